@@ -12,6 +12,9 @@ This script demonstrates how to:
 
 Usage:
     python prototype_fetch_exadata.py [--profile <profile_name>] [--output <output_file>]
+                                      [--refresh-cache] [--cache-ttl <seconds>]
+                                      [--compartment-id <ocid> ...] [--infra-id <ocid> ...]
+                                      [-v | -vv | -q]
 
 Examples:
     # Scan all compartments in the tenancy
@@ -22,26 +25,316 @@ Examples:
 
     # Specify custom output file
     python prototype_fetch_exadata.py --output my_data.json
+
+    # Rediscover compartments instead of using the cached list
+    python prototype_fetch_exadata.py --refresh-cache
+
+    # Only scan a specific compartment
+    python prototype_fetch_exadata.py --compartment-id ocid1.compartment.oc1..aaa
 """
 
 import oci
+import orjson
+import os
 import sys
 import json
+import time
+import queue
+import logging
 import argparse
-from typing import Dict, List, Optional
+import tempfile
+import threading
+import functools
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on OCI requests in flight at once, across all fan-out levels
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum page size accepted by the OCI list endpoints used here
+PAGE_SIZE = 1000
+
+# oci.pagination already retries every page with DEFAULT_RETRY_STRATEGY, so the list
+# operations it drives must not retry again through the client's retry strategy
+PAGINATED_RETRY_STRATEGY = oci.retry.NoneRetryStrategy()
+
+# Connections kept alive per OCI client; sized for the concurrent fan-out above
+CONNECTION_POOL_SIZE = 64
+
+# Location and default lifetime of the on-disk compartment cache
+CACHE_DIR = os.path.expanduser("~/.oci/exadata_fetch_cache")
+DEFAULT_CACHE_TTL = 86400
+
+# ServiceError statuses that indicate cached compartments may be stale
+CACHE_INVALIDATING_STATUSES = {401, 404}
+
+# Resource Search query locating every Exadata infrastructure in the tenancy
+EXADATA_SEARCH_QUERY = "query exadatainfrastructure resources where lifecycleState != 'TERMINATED'"
+
+# Model attributes exported to the JSON output file
+INFRASTRUCTURE_JSON_FIELDS = (
+    "id",
+    "display_name",
+    "lifecycle_state",
+    "shape",
+    "compute_count",
+    "storage_count",
+    "cpus_enabled",
+    "max_cpu_count",
+    "memory_size_in_gbs",
+    "data_storage_size_in_tbs",
+)
+VM_CLUSTER_JSON_FIELDS = (
+    "id",
+    "display_name",
+    "lifecycle_state",
+    "gi_version",
+    "cpus_enabled",
+    "memory_size_in_gbs",
+    "data_storage_size_in_tbs",
+)
+
+# Fields kept from the raw (undeserialized) list responses
+COMPARTMENT_SUMMARY_FIELDS = ("id", "name", "lifecycle_state")
+INFRASTRUCTURE_SUMMARY_FIELDS = ("id", "display_name")
+VM_CLUSTER_SUMMARY_FIELDS = ("id", "display_name", "exadata_infrastructure_id")
+
+# orjson options for the JSON output file; datetimes from OCI models are encoded natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+# Exit status when some compartments could not be scanned
+PARTIAL_RESULTS_EXIT_CODE = 2
+
+# ServiceError statuses meaning an optional lookup is not supported for a resource
+OPTIONAL_LOOKUP_STATUSES = {400, 404}
+
+
+@dataclass
+class VmClusterResult:
+    """VM cluster details with its IORM configuration and most recent patches."""
+
+    # Explicit __slots__ instead of dataclass(slots=True), which needs Python 3.10+
+    __slots__ = ("cluster", "iorm_config", "patches")
+
+    cluster: oci.database.models.VmCluster
+    iorm_config: Optional[oci.database.models.ExadataIormConfig]
+    patches: List[oci.database.models.PatchSummary]
+
+
+@dataclass
+class InfraResult:
+    """Exadata infrastructure details, resource usage and the VM clusters it hosts."""
+
+    __slots__ = ("infrastructure", "ocpu_info", "unallocated_resources", "vm_clusters")
+
+    infrastructure: oci.database.models.ExadataInfrastructure
+    ocpu_info: Optional[oci.database.models.OCPUs]
+    unallocated_resources: Optional[oci.database.models.ExadataInfrastructureUnAllocatedResources]
+    vm_clusters: List[VmClusterResult]
+
+
+@dataclass
+class CompartmentResult:
+    """Exadata infrastructures found in a compartment."""
+
+    __slots__ = ("compartment_id", "compartment_name", "infrastructures")
+
+    compartment_id: str
+    compartment_name: str
+    infrastructures: List[InfraResult]
+
+
+def _resize_connection_pool(client, pool_size: int = CONNECTION_POOL_SIZE) -> None:
+    """
+    Remount the HTTPS adapter of an OCI client with a larger keep-alive pool.
+
+    The default pool holds 10 connections, which the concurrent scan exhausts,
+    forcing new TCP/TLS handshakes. The adapter class is preserved so OCI's own
+    transport behavior (OCIHTTPAdapter) stays in place.
+
+    Args:
+        client: OCI SDK service client (e.g. DatabaseClient)
+        pool_size: Number of pooled connections to keep per host
+    """
+    session = client.base_client.session
+    adapter = session.get_adapter("https://")
+
+    if getattr(adapter, "_pool_maxsize", 0) >= pool_size:
+        return
+
+    session.mount("https://", adapter.__class__(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=adapter.max_retries
+    ))
+
+
+# Request slots shared by every thread of the process; see _call
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _call(operation: Callable, *args, **kwargs):
+    """
+    Call an OCI SDK operation while holding one of the process-wide request slots.
+
+    Requests are issued both from the shared request pool and from the threads
+    coordinating the scan (list calls); the shared semaphore keeps the number of
+    requests actually in flight at MAX_CONCURRENT_REQUESTS across all of them.
+
+    Args:
+        operation: Bound SDK client method, e.g. db_client.get_vm_cluster
+        *args: Positional arguments for the operation
+        **kwargs: Keyword arguments for the operation
+
+    Returns:
+        The operation's oci.response.Response
+    """
+    with _request_slots:
+        return operation(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_compartment(identity_client, compartment_id: str):
+    """
+    Get a compartment, memoized per identity client and compartment OCID.
+
+    SDK clients hash by identity, so each client keeps its own entries. Failed
+    lookups raise and are therefore never cached.
+
+    Args:
+        identity_client: oci.identity.IdentityClient used for the lookup
+        compartment_id: OCI compartment OCID
+
+    Returns:
+        oci.identity.models.Compartment
+    """
+    return _call(identity_client.get_compartment, compartment_id=compartment_id).data
+
+
+def _camel_case(name: str) -> str:
+    """Convert a snake_case model attribute name to the camelCase key used on the wire."""
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+def _raw_fields(item: Dict, fields: Tuple[str, ...]) -> Dict:
+    """
+    Pick fields from a raw OCI JSON object, keyed by their snake_case model attribute names.
+
+    Args:
+        item: JSON object as returned by a client created with skip_deserialization=True
+        fields: snake_case attribute names (e.g. "display_name")
+
+    Returns:
+        Dictionary with the requested fields, None for fields missing from the response
+    """
+    return {field: item.get(_camel_case(field)) for field in fields}
+
+
+def _describe_error(error: Exception) -> str:
+    """Short description of an error, using status and message for OCI service errors."""
+    if isinstance(error, oci.exceptions.ServiceError):
+        return f"{error.status} - {error.message}"
+    return str(error)
+
+
+def _optional_result(future: Future, description: str):
+    """
+    Return the response data of an optional lookup, or None if it is not supported.
+
+    Only 400/404 responses are treated as "not supported" and logged at DEBUG level.
+    Throttling and server errors have already been retried by the SDK retry strategy
+    and are re-raised, as are all other errors.
+
+    Args:
+        future: Future resolving to an OCI response
+        description: Human readable name of the lookup for log messages
+    """
+    try:
+        return future.result().data
+    except oci.exceptions.ServiceError as e:
+        if e.status not in OPTIONAL_LOOKUP_STATUSES:
+            raise
+        logger.debug(f"Skipping {description}: {e.status} - {e.message}")
+        return None
+
+
+class _CompartmentCache:
+    """On-disk JSON cache of the compartments a user can access in a tenancy, expired by file mtime."""
+
+    def __init__(self, tenancy_id: str, principal: str, ttl: int = DEFAULT_CACHE_TTL, cache_dir: str = CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            tenancy_id: Tenancy OCID the cached compartments belong to
+            principal: User OCID (or profile name) the list was discovered as; accessible
+                compartments differ between users of the same tenancy
+            ttl: Maximum age of the cache file in seconds
+            cache_dir: Directory holding the cache files
+        """
+        self.ttl = ttl
+        self.path = os.path.join(cache_dir, f"compartments-{tenancy_id}-{principal}.json")
+
+    def get(self) -> Optional[List[Dict]]:
+        """Return the cached compartments, or None if missing, expired or unreadable."""
+        try:
+            if time.time() - os.path.getmtime(self.path) >= self.ttl:
+                return None
+
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, compartments: List[Dict]) -> None:
+        """Atomically write the compartment list to the cache file."""
+        cache_dir = os.path.dirname(self.path)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(compartments, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def invalidate(self) -> None:
+        """Remove the cache file if present."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
 
 
 class ExadataDataFetcher:
     """Fetches ExadataCC infrastructure and VM cluster data from OCI."""
 
-    def __init__(self, config_file: Optional[str] = None, profile: str = "DEFAULT"):
+    def __init__(
+        self,
+        config_file: Optional[str] = None,
+        profile: str = "DEFAULT",
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        refresh_cache: bool = False
+    ):
         """
         Initialize the ExadataDataFetcher.
 
         Args:
             config_file: Path to OCI config file (default: ~/.oci/config)
             profile: Profile name to use from config file
+            cache_ttl: Lifetime of the cached compartment list in seconds (0 disables reuse)
+            refresh_cache: Ignore any cached compartment list and fetch it again
         """
+        self.log = logger
+
         if config_file:
             self.config = oci.config.from_file(file_location=config_file, profile_name=profile)
         else:
@@ -50,68 +343,155 @@ class ExadataDataFetcher:
         # Validate configuration
         oci.config.validate_config(self.config)
 
-        # Create clients
-        self.db_client = oci.database.DatabaseClient(self.config)
-        self.identity_client = oci.identity.IdentityClient(self.config)
+        # Build the signer once and share it between all clients, loading the API signing
+        # key only once; profiles such as Cloud Shell's delegation token set authentication_type
+        if oci.util.AUTHENTICATION_TYPE_FIELD_NAME in self.config:
+            self.signer = oci.util.get_signer_from_authentication_type(self.config)
+        else:
+            # Built like the SDK clients do, so both key_file and key_content profiles work
+            self.signer = oci.signer.Signer(
+                tenancy=self.config["tenancy"],
+                user=self.config["user"],
+                fingerprint=self.config["fingerprint"],
+                private_key_file_location=self.config.get("key_file"),
+                pass_phrase=self.config.get("pass_phrase"),
+                private_key_content=self.config.get("key_content")
+            )
+
+        # Create clients; throttling (429) and transient 5xx errors are retried by the SDK
+        # (by oci.pagination instead for paginated list calls, see PAGINATED_RETRY_STRATEGY)
+        client_kwargs = {"signer": self.signer, "retry_strategy": oci.retry.DEFAULT_RETRY_STRATEGY}
+        self.db_client = oci.database.DatabaseClient(self.config, **client_kwargs)
+        self.identity_client = oci.identity.IdentityClient(self.config, **client_kwargs)
+        self.search_client = oci.resource_search.ResourceSearchClient(self.config, **client_kwargs)
+
+        # List calls only need a few fields per item, so they return the raw JSON
+        # instead of building a full SDK model for every item
+        self.raw_db_client = oci.database.DatabaseClient(self.config, skip_deserialization=True, **client_kwargs)
+        self.raw_identity_client = oci.identity.IdentityClient(
+            self.config, skip_deserialization=True, **client_kwargs
+        )
+
+        # Reuse keep-alive connections across concurrent requests
+        for client in (self.db_client, self.identity_client, self.raw_db_client, self.raw_identity_client):
+            _resize_connection_pool(client)
+
+        # Individual requests run on one shared pool; fan-out levels queue work on it
+        # instead of each starting threads of their own
+        self._request_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="oci-request"
+        )
 
         # Get tenancy ID from config
         self.tenancy_id = self.config["tenancy"]
 
-    def list_all_compartments(self) -> List[Dict]:
+        # Compartment trees rarely change, so the discovered list is cached on disk
+        self._compartment_cache = _CompartmentCache(
+            self.tenancy_id, self.config.get("user") or profile, ttl=cache_ttl
+        )
+        self.refresh_cache = refresh_cache
+        # Whether the last list_all_compartments call was served from the on-disk cache
+        self._compartments_from_cache = False
+
+    def list_all_compartments(self, refresh: bool = False) -> List[Dict]:
         """
         List all compartments in the tenancy, including nested compartments.
 
+        The result is served from the on-disk compartment cache when it is fresh,
+        unless refresh_cache was requested.
+
+        Args:
+            refresh: Ignore the on-disk compartment cache for this call
+
         Returns:
             List of compartment objects with id, name, and lifecycle_state
         """
-        try:
-            print(f"Discovering compartments in tenancy: {self.tenancy_id}")
+        if not (refresh or self.refresh_cache):
+            cached = self._compartment_cache.get()
+            if cached is not None:
+                self.log.info(f"Using {len(cached)} cached compartment(s) for tenancy: {self.tenancy_id}")
+                self._compartments_from_cache = True
+                return cached
 
-            all_compartments = []
+        self._compartments_from_cache = False
+
+        try:
+            self.log.info(f"Discovering compartments in tenancy: {self.tenancy_id}")
 
             # Add root compartment (tenancy itself)
-            tenancy = self.identity_client.get_tenancy(tenancy_id=self.tenancy_id).data
-            all_compartments.append({
+            tenancy = _call(self.identity_client.get_tenancy, tenancy_id=self.tenancy_id).data
+            all_compartments = [{
                 "id": tenancy.id,
                 "name": tenancy.name,
                 "lifecycle_state": "ACTIVE",
                 "is_root": True
-            })
-
-            # List all compartments recursively
-            def list_compartments_recursive(parent_compartment_id):
-                page = None
-                while True:
-                    response = self.identity_client.list_compartments(
-                        compartment_id=parent_compartment_id,
-                        compartment_id_in_subtree=True,
-                        access_level="ACCESSIBLE",
-                        page=page
-                    )
+            }]
+
+            # compartment_id_in_subtree already covers all nested compartments, and
+            # only ACTIVE compartments are requested from the service
+            compartments = oci.pagination.list_call_get_all_results(
+                _call,
+                self.raw_identity_client.list_compartments,
+                compartment_id=self.tenancy_id,
+                compartment_id_in_subtree=True,
+                access_level="ACCESSIBLE",
+                lifecycle_state="ACTIVE",
+                limit=PAGE_SIZE,
+                retry_strategy=PAGINATED_RETRY_STRATEGY
+            ).data
 
-                    for compartment in response.data:
-                        # Only include ACTIVE compartments
-                        if compartment.lifecycle_state == "ACTIVE":
-                            all_compartments.append({
-                                "id": compartment.id,
-                                "name": compartment.name,
-                                "lifecycle_state": compartment.lifecycle_state,
-                                "is_root": False
-                            })
+            all_compartments.extend(
+                {**_raw_fields(compartment, COMPARTMENT_SUMMARY_FIELDS), "is_root": False}
+                for compartment in compartments
+            )
 
-                    page = response.next_page
-                    if not page:
-                        break
+            self.log.info(f"Found {len(all_compartments)} accessible compartment(s)")
 
-            list_compartments_recursive(self.tenancy_id)
+            # The cache is only an optimization, e.g. HOME may be read-only for a Checkmk site user
+            try:
+                self._compartment_cache.put(all_compartments)
+            except OSError as e:
+                self.log.warning(f"Could not write compartment cache {self._compartment_cache.path}: {e}")
 
-            print(f"Found {len(all_compartments)} accessible compartment(s)\n")
             return all_compartments
 
         except oci.exceptions.ServiceError as e:
-            print(f"Service Error: {e.status} - {e.message}")
+            self.log.error(f"Service Error: {e.status} - {e.message}")
+            if e.status in CACHE_INVALIDATING_STATUSES:
+                self._compartment_cache.invalidate()
             raise
 
+    def find_exadata_compartment_ids(self) -> Optional[Set[str]]:
+        """
+        Find the compartments holding Exadata infrastructures with one Resource Search query.
+
+        The search index is eventually consistent, so an empty result is treated like
+        an unavailable search rather than as proof that the tenancy has no Exadata.
+
+        Returns:
+            Set of compartment OCIDs, or None if the search failed or found nothing
+        """
+        try:
+            resources = oci.pagination.list_call_get_all_results(
+                _call,
+                self.search_client.search_resources,
+                oci.resource_search.models.StructuredSearchDetails(
+                    type="Structured",
+                    query=EXADATA_SEARCH_QUERY,
+                    matching_context_type="NONE"
+                ),
+                limit=PAGE_SIZE,
+                retry_strategy=PAGINATED_RETRY_STRATEGY
+            ).data
+        except (oci.exceptions.ServiceError, oci.exceptions.RequestException, oci.exceptions.ConnectTimeout) as e:
+            self.log.warning(f"Resource Search unavailable ({_describe_error(e)}), scanning every compartment")
+            return None
+
+        if not resources:
+            return None
+
+        return {resource.compartment_id for resource in resources}
+
     def list_exadata_infrastructures(self, compartment_id: str) -> List[Dict]:
         """
         List all Exadata infrastructures in a compartment.
@@ -120,76 +500,93 @@ class ExadataDataFetcher:
             compartment_id: OCI compartment OCID
 
         Returns:
-            List of ExadataInfrastructure objects as dictionaries
+            List of infrastructure dictionaries with the INFRASTRUCTURE_SUMMARY_FIELDS keys
         """
         try:
-            all_infrastructures = []
-            page = None
-
-            while True:
-                response = self.db_client.list_exadata_infrastructures(
-                    compartment_id=compartment_id,
-                    sort_by="DISPLAYNAME",
-                    sort_order="ASC",
-                    page=page
-                )
-
-                all_infrastructures.extend(response.data)
-                page = response.next_page
-
-                if not page:
-                    break
-
-            return all_infrastructures
+            infrastructures = oci.pagination.list_call_get_all_results(
+                _call,
+                self.raw_db_client.list_exadata_infrastructures,
+                compartment_id=compartment_id,
+                sort_by="DISPLAYNAME",
+                sort_order="ASC",
+                limit=PAGE_SIZE,
+                retry_strategy=PAGINATED_RETRY_STRATEGY
+            ).data
+            return [_raw_fields(infra, INFRASTRUCTURE_SUMMARY_FIELDS) for infra in infrastructures]
 
         except oci.exceptions.ServiceError as e:
-            print(f"Service Error: {e.status} - {e.message}")
+            self.log.error(f"Service Error: {e.status} - {e.message}")
             raise
         except oci.exceptions.RequestException as e:
-            print(f"Request Error: {e}")
+            self.log.error(f"Request Error: {e}")
             raise
 
-    def get_exadata_infrastructure_details(self, exadata_infrastructure_id: str) -> Dict:
+    def _submit(self, operation: Callable, **kwargs) -> Future:
+        """Queue one SDK call on the shared request pool, holding a request slot while it runs."""
+        return self._request_executor.submit(_call, operation, **kwargs)
+
+    def _submit_infrastructure_details(self, exadata_infrastructure_id: str) -> Callable[[], InfraResult]:
         """
-        Get detailed information about an Exadata infrastructure.
+        Queue the detail requests of an Exadata infrastructure on the shared request pool.
+
+        Callers queue the requests of many resources before waiting on any of them.
+        The returned function blocks, so it must not be called from a request pool worker.
 
         Args:
             exadata_infrastructure_id: ExadataInfrastructure OCID
 
         Returns:
-            ExadataInfrastructure object with additional resource info
+            Function waiting for the requests and returning the InfraResult
         """
-        try:
-            # Get basic infrastructure details
-            infra = self.db_client.get_exadata_infrastructure(
-                exadata_infrastructure_id=exadata_infrastructure_id
-            ).data
-
-            # Get OCPU information
+        # The three requests are independent, so issue them concurrently
+        f_infra = self._submit(
+            self.db_client.get_exadata_infrastructure,
+            exadata_infrastructure_id=exadata_infrastructure_id
+        )
+        f_ocpu = self._submit(
+            self.db_client.get_exadata_infrastructure_ocpus,
+            exadata_infrastructure_id=exadata_infrastructure_id
+        )
+        f_unallocated = self._submit(
+            self.db_client.get_exadata_infrastructure_un_allocated_resources,
+            exadata_infrastructure_id=exadata_infrastructure_id
+        )
+
+        def result() -> InfraResult:
             try:
-                ocpu_info = self.db_client.get_exadata_infrastructure_ocpus(
-                    exadata_infrastructure_id=exadata_infrastructure_id
-                ).data
-            except:
-                ocpu_info = None
+                # Get basic infrastructure details
+                infra = f_infra.result().data
 
-            # Get unallocated resources
-            try:
-                unallocated = self.db_client.get_exadata_infrastructure_un_allocated_resources(
-                    exadata_infrastructure_id=exadata_infrastructure_id
-                ).data
-            except:
-                unallocated = None
-
-            return {
-                "infrastructure": infra,
-                "ocpu_info": ocpu_info,
-                "unallocated_resources": unallocated
-            }
+                # Get OCPU information
+                ocpu_info = _optional_result(f_ocpu, f"OCPU info of {exadata_infrastructure_id}")
 
-        except oci.exceptions.ServiceError as e:
-            print(f"Service Error fetching infrastructure details: {e.status} - {e.message}")
-            raise
+                # Get unallocated resources
+                unallocated = _optional_result(f_unallocated, f"unallocated resources of {exadata_infrastructure_id}")
+
+                return InfraResult(
+                    infrastructure=infra,
+                    ocpu_info=ocpu_info,
+                    unallocated_resources=unallocated,
+                    vm_clusters=[]
+                )
+
+            except oci.exceptions.ServiceError as e:
+                self.log.error(f"Service Error fetching infrastructure details: {e.status} - {e.message}")
+                raise
+
+        return result
+
+    def get_exadata_infrastructure_details(self, exadata_infrastructure_id: str) -> InfraResult:
+        """
+        Get detailed information about an Exadata infrastructure.
+
+        Args:
+            exadata_infrastructure_id: ExadataInfrastructure OCID
+
+        Returns:
+            InfraResult with additional resource info and no VM clusters filled in yet
+        """
+        return self._submit_infrastructure_details(exadata_infrastructure_id)()
 
     def list_vm_clusters(self, compartment_id: str, exadata_infrastructure_id: Optional[str] = None) -> List[Dict]:
         """
@@ -200,34 +597,66 @@ class ExadataDataFetcher:
             exadata_infrastructure_id: Optional infrastructure OCID to filter by
 
         Returns:
-            List of VmCluster objects
+            List of VM cluster dictionaries with the VM_CLUSTER_SUMMARY_FIELDS keys
         """
         try:
-            all_clusters = []
-            page = None
-
-            while True:
-                response = self.db_client.list_vm_clusters(
-                    compartment_id=compartment_id,
-                    exadata_infrastructure_id=exadata_infrastructure_id,
-                    sort_by="DISPLAYNAME",
-                    sort_order="ASC",
-                    page=page
-                )
+            clusters = oci.pagination.list_call_get_all_results(
+                _call,
+                self.raw_db_client.list_vm_clusters,
+                compartment_id=compartment_id,
+                exadata_infrastructure_id=exadata_infrastructure_id,
+                sort_by="DISPLAYNAME",
+                sort_order="ASC",
+                limit=PAGE_SIZE,
+                retry_strategy=PAGINATED_RETRY_STRATEGY
+            ).data
+            return [_raw_fields(cluster, VM_CLUSTER_SUMMARY_FIELDS) for cluster in clusters]
 
-                all_clusters.extend(response.data)
-                page = response.next_page
+        except oci.exceptions.ServiceError as e:
+            self.log.error(f"Service Error: {e.status} - {e.message}")
+            raise
 
-                if not page:
-                    break
+    def _submit_vm_cluster_details(self, vm_cluster_id: str) -> Callable[[], VmClusterResult]:
+        """
+        Queue the detail requests of a VM cluster on the shared request pool.
 
-            return all_clusters
+        See _submit_infrastructure_details.
 
-        except oci.exceptions.ServiceError as e:
-            print(f"Service Error: {e.status} - {e.message}")
-            raise
+        Args:
+            vm_cluster_id: VmCluster OCID
 
-    def get_vm_cluster_details(self, vm_cluster_id: str) -> Dict:
+        Returns:
+            Function waiting for the requests and returning the VmClusterResult
+        """
+        # The three requests are independent, so issue them concurrently
+        f_cluster = self._submit(self.db_client.get_vm_cluster, vm_cluster_id=vm_cluster_id)
+        f_iorm = self._submit(self.db_client.get_vm_cluster_iorm_config, vm_cluster_id=vm_cluster_id)
+        f_patches = self._submit(self.db_client.list_vm_cluster_patches, vm_cluster_id=vm_cluster_id)
+
+        def result() -> VmClusterResult:
+            try:
+                # Get basic cluster details
+                cluster = f_cluster.result().data
+
+                # Get IORM configuration
+                iorm_config = _optional_result(f_iorm, f"IORM config of {vm_cluster_id}")
+
+                # List available patches (limit to 5 most recent)
+                patches = (_optional_result(f_patches, f"patches of {vm_cluster_id}") or [])[:5]
+
+                return VmClusterResult(
+                    cluster=cluster,
+                    iorm_config=iorm_config,
+                    patches=patches
+                )
+
+            except oci.exceptions.ServiceError as e:
+                self.log.error(f"Service Error fetching VM cluster details: {e.status} - {e.message}")
+                raise
+
+        return result
+
+    def get_vm_cluster_details(self, vm_cluster_id: str) -> VmClusterResult:
         """
         Get detailed information about a VM cluster.
 
@@ -235,205 +664,565 @@ class ExadataDataFetcher:
             vm_cluster_id: VmCluster OCID
 
         Returns:
-            VmCluster object with additional info
+            VmClusterResult with additional info
         """
-        try:
-            # Get basic cluster details
-            cluster = self.db_client.get_vm_cluster(vm_cluster_id=vm_cluster_id).data
+        return self._submit_vm_cluster_details(vm_cluster_id)()
 
-            # Get IORM configuration
-            try:
-                iorm_config = self.db_client.get_vm_cluster_iorm_config(
-                    vm_cluster_id=vm_cluster_id
-                ).data
-            except:
-                iorm_config = None
+    def get_compartment(self, compartment_id: str) -> Dict:
+        """
+        Get a single compartment entry, shaped like those of list_all_compartments.
 
-            # List available patches (limit to 5 most recent)
-            try:
-                patches = self.db_client.list_vm_cluster_patches(
-                    vm_cluster_id=vm_cluster_id
-                ).data[:5]
-            except:
-                patches = []
-
-            return {
-                "cluster": cluster,
-                "iorm_config": iorm_config,
-                "patches": patches
-            }
+        The entry is taken from the on-disk compartment cache when it is fresh, and
+        identity lookups are memoized for the lifetime of the process.
+
+        Args:
+            compartment_id: OCI compartment OCID (the tenancy OCID for the root compartment)
+
+        Returns:
+            Compartment entry with id, name, lifecycle_state and is_root
+        """
+        if not self.refresh_cache:
+            for cached in self._compartment_cache.get() or []:
+                if cached["id"] == compartment_id:
+                    return cached
+
+        compartment = _lookup_compartment(self.identity_client, compartment_id)
+        return {
+            "id": compartment_id,
+            "name": compartment.name,
+            "lifecycle_state": compartment.lifecycle_state,
+            "is_root": compartment_id == self.tenancy_id
+        }
+
+    def _list_vm_clusters_by_infra(self, compartment_id: str) -> Dict[str, List]:
+        """List a compartment's VM clusters once and group them by infrastructure OCID."""
+        clusters_by_infra = collections.defaultdict(list)
+        for cluster in self.list_vm_clusters(compartment_id=compartment_id):
+            clusters_by_infra[cluster["exadata_infrastructure_id"]].append(cluster)
+        return clusters_by_infra
+
+    def _submit_vm_clusters(self, vm_clusters: List[Dict]) -> List[Callable[[], VmClusterResult]]:
+        """
+        Queue the detail requests of VM clusters on the shared request pool.
+
+        Args:
+            vm_clusters: VM cluster dictionaries as returned by list_vm_clusters
+
+        Returns:
+            One function per VM cluster returning its VmClusterResult, see _submit_vm_cluster_details
+        """
+        pending = []
+        for cluster in vm_clusters:
+            self.log.info(f"    Processing VM cluster: {cluster['display_name']}")
+            pending.append(self._submit_vm_cluster_details(cluster["id"]))
+        return pending
+
+    def _scan_compartment(self, compartment: Dict) -> Optional[CompartmentResult]:
+        """
+        Scan a single compartment for Exadata infrastructures and VM clusters.
 
+        Args:
+            compartment: Compartment entry as returned by list_all_compartments
+
+        Returns:
+            CompartmentResult, or None if no infrastructures were found
+        """
+        comp_id = compartment["id"]
+        comp_name = compartment["name"]
+
+        self.log.info(f"Scanning compartment: {comp_name} ({comp_id})")
+
+        # Get all infrastructures in this compartment
+        try:
+            infrastructures = self.list_exadata_infrastructures(comp_id)
         except oci.exceptions.ServiceError as e:
-            print(f"Service Error fetching VM cluster details: {e.status} - {e.message}")
+            # A cached compartment may have been deleted or become inaccessible
+            if e.status in CACHE_INVALIDATING_STATUSES:
+                self._compartment_cache.invalidate()
+                _lookup_compartment.cache_clear()
             raise
 
-    def fetch_all_data(self) -> Dict:
+        if not infrastructures:
+            return None
+
+        self.log.info(f"  Found {len(infrastructures)} infrastructure(s) in {comp_name}")
+
+        clusters_by_infra = self._list_vm_clusters_by_infra(comp_id)
+
+        # Queue every detail request of the compartment before waiting on any of them
+        pending = []
+        for infra in infrastructures:
+            self.log.info(f"  Processing infrastructure: {infra['display_name']}")
+            pending.append((
+                self._submit_infrastructure_details(infra["id"]),
+                self._submit_vm_clusters(clusters_by_infra.get(infra["id"], []))
+            ))
+
+        infra_entries = []
+        for infra_result, cluster_results in pending:
+            infra_details = infra_result()
+            infra_details.vm_clusters = [cluster_result() for cluster_result in cluster_results]
+            infra_entries.append(infra_details)
+
+        return CompartmentResult(
+            compartment_id=comp_id,
+            compartment_name=comp_name,
+            infrastructures=infra_entries
+        )
+
+    def _scan_infrastructure_ids(self, infra_ids: List[str], errors: List[Dict]) -> Iterator[CompartmentResult]:
         """
-        Fetch all ExadataCC data from the tenancy.
+        Fetch specific Exadata infrastructures by OCID, skipping compartment discovery.
 
-        Scans all compartments in the tenancy for ExadataCC resources.
+        An infrastructure or compartment that fails is recorded in errors instead of
+        aborting the others, as in _scan_compartments.
+
+        Args:
+            infra_ids: ExadataInfrastructure OCIDs
+            errors: List receiving an {"infrastructure_id" or "compartment_id", "error"} dict per failure
+
+        Yields:
+            One CompartmentResult per compartment holding the infrastructures
+        """
+        self.log.info(f"Fetching {len(infra_ids)} infrastructure(s) by OCID")
+
+        infra_details_list = self._run_each(
+            self.get_exadata_infrastructure_details, infra_ids, str, "infrastructure_id", errors
+        )
+
+        # Group by compartment, keeping the order the infrastructures were given in
+        details_by_compartment = {}
+        for infra_details in infra_details_list:
+            comp_id = infra_details.infrastructure.compartment_id
+            details_by_compartment.setdefault(comp_id, []).append(infra_details)
+
+        def scan_compartment_infrastructures(comp_id):
+            compartment_details = details_by_compartment[comp_id]
+            compartment = self.get_compartment(comp_id)
+            self.log.info(f"  Processing {len(compartment_details)} infrastructure(s) in {compartment['name']}")
+
+            clusters_by_infra = self._list_vm_clusters_by_infra(comp_id)
+
+            # Queue the VM cluster requests of every infrastructure before waiting on any of them
+            pending = [
+                (infra_details, self._submit_vm_clusters(clusters_by_infra.get(infra_details.infrastructure.id, [])))
+                for infra_details in compartment_details
+            ]
+            for infra_details, cluster_results in pending:
+                infra_details.vm_clusters = [cluster_result() for cluster_result in cluster_results]
+
+            return CompartmentResult(
+                compartment_id=comp_id,
+                compartment_name=compartment["name"],
+                infrastructures=compartment_details
+            )
+
+        yield from self._run_each(
+            scan_compartment_infrastructures, list(details_by_compartment), str, "compartment_id", errors
+        )
+
+    def _compartments_to_scan(self, compartment_ids: Optional[List[str]], errors: List[Dict]) -> List[Dict]:
+        """
+        Determine which compartments to scan.
+
+        Args:
+            compartment_ids: Explicit compartment OCIDs; skips tenancy-wide discovery
+            errors: List receiving a {"compartment_id", "error"} dict per requested
+                compartment that could not be looked up
 
         Returns:
-            Dictionary containing all infrastructure and VM cluster data organized by compartment
+            Compartment entries shaped like those of list_all_compartments
         """
-        result = {
-            "tenancy_id": self.tenancy_id,
-            "compartments": []
-        }
+        if compartment_ids:
+            self.log.info(f"Scanning {len(compartment_ids)} requested compartment(s)")
+            return list(self._run_each(self.get_compartment, compartment_ids, str, "compartment_id", errors))
 
         # Get all compartments in the tenancy
         compartments_to_scan = self.list_all_compartments()
 
-        # Scan each compartment for Exadata resources
-        total_infrastructures = 0
-        total_vm_clusters = 0
+        # Skip compartments that Resource Search reports as holding no Exadata infrastructure
+        exadata_compartment_ids = self.find_exadata_compartment_ids()
+        if exadata_compartment_ids is not None:
+            # Compartments created after the cached list was written must not be dropped
+            known_ids = {compartment["id"] for compartment in compartments_to_scan}
+            if not exadata_compartment_ids <= known_ids and self._compartments_from_cache:
+                self.log.info("Resource Search found compartments missing from the compartment list, rediscovering")
+                compartments_to_scan = self.list_all_compartments(refresh=True)
+
+            compartments_to_scan = [
+                compartment for compartment in compartments_to_scan
+                if compartment["id"] in exadata_compartment_ids
+            ]
+            self.log.info(f"Resource Search found Exadata infrastructure in {len(compartments_to_scan)} compartment(s)")
+
+            # The search index lags behind, e.g. for compartments deleted in the meantime
+            unknown_ids = exadata_compartment_ids - {compartment["id"] for compartment in compartments_to_scan}
+            if unknown_ids:
+                self.log.warning(
+                    f"Skipping {len(unknown_ids)} compartment(s) reported by Resource Search that are not "
+                    f"active and accessible: {', '.join(sorted(unknown_ids))}"
+                )
 
-        for compartment in compartments_to_scan:
-            comp_id = compartment["id"]
-            comp_name = compartment["name"]
+        return compartments_to_scan
 
-            print(f"Scanning compartment: {comp_name} ({comp_id})")
+    def _run_each(
+        self, work: Callable, items: List, item_id: Callable[[Any], str], error_key: str, errors: List[Dict]
+    ) -> Iterator:
+        """
+        Run work on each item concurrently, yielding the results in the given order.
 
-            # Get all infrastructures in this compartment
-            infrastructures = self.list_exadata_infrastructures(comp_id)
+        Work runs on its own pool rather than the shared request pool, since it usually
+        waits on requests queued there; it must not start pools of its own.
 
-            if not infrastructures:
-                print(f"  No Exadata infrastructures found\n")
-                continue
+        An item that fails is recorded in errors instead of aborting the others; the
+        first error is only raised if every item failed. Work that has not started yet
+        is cancelled if iteration stops early (e.g. on KeyboardInterrupt). Failures are
+        not logged again here: the fetch methods already log OCI service errors, and
+        every failure is reported from errors at the end of the run.
 
-            print(f"  Found {len(infrastructures)} infrastructure(s)")
-            total_infrastructures += len(infrastructures)
+        Args:
+            work: Function called with each item
+            items: Items to process
+            item_id: Returns the OCID recorded for a failed item
+            error_key: Key of the OCID in the recorded error, e.g. "compartment_id"
+            errors: List receiving an {error_key, "error"} dict per failed item
+
+        Yields:
+            Result of work for each item that succeeded
+        """
+        first_error = None
+        failures = 0
 
-            compartment_data = {
-                "compartment_id": comp_id,
-                "compartment_name": comp_name,
-                "infrastructures": []
-            }
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = [executor.submit(work, item) for item in items]
 
-            for infra in infrastructures:
-                print(f"  Processing infrastructure: {infra.display_name}")
+            try:
+                for item, future in zip(items, futures):
+                    try:
+                        item_result = future.result()
+                    except Exception as e:
+                        errors.append({error_key: item_id(item), "error": _describe_error(e)})
+                        failures += 1
+                        first_error = first_error or e
+                        continue
+
+                    yield item_result
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        if first_error and failures == len(items):
+            raise first_error
+
+    def _scan_compartments(self, compartments_to_scan: List[Dict], errors: List[Dict]) -> Iterator[CompartmentResult]:
+        """
+        Scan compartments concurrently, yielding results in the given order.
 
-                # Get detailed infrastructure info
-                infra_details = self.get_exadata_infrastructure_details(infra.id)
+        A compartment that fails to scan is recorded in errors instead of aborting the
+        whole scan; see _run_each.
 
-                # Get VM clusters for this infrastructure
-                vm_clusters = self.list_vm_clusters(
-                    compartment_id=comp_id,
-                    exadata_infrastructure_id=infra.id
-                )
+        Args:
+            compartments_to_scan: Compartment entries shaped like those of list_all_compartments
+            errors: List receiving a {"compartment_id", "error"} dict per failed compartment
 
-                # Get detailed info for each VM cluster
-                vm_clusters_details = []
-                for cluster in vm_clusters:
-                    print(f"    Processing VM cluster: {cluster.display_name}")
-                    cluster_details = self.get_vm_cluster_details(cluster.id)
-                    vm_clusters_details.append(cluster_details)
-                    total_vm_clusters += 1
+        Yields:
+            CompartmentResult for each compartment holding Exadata infrastructure
+        """
+        compartment_results = self._run_each(
+            self._scan_compartment,
+            compartments_to_scan,
+            lambda compartment: compartment["id"],
+            "compartment_id",
+            errors
+        )
+
+        for compartment_result in compartment_results:
+            if compartment_result:
+                yield compartment_result
+
+    def fetch_all_data(
+        self,
+        on_compartment: Optional[Callable[[CompartmentResult], None]] = None,
+        compartment_ids: Optional[List[str]] = None,
+        infra_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Fetch all ExadataCC data from the tenancy.
 
-                compartment_data["infrastructures"].append({
-                    "details": infra_details,
-                    "vm_clusters": vm_clusters_details
-                })
+        Scans all compartments in the tenancy for ExadataCC resources. Compartments are
+        scanned concurrently (bounded by MAX_CONCURRENT_REQUESTS) since the work is
+        dominated by OCI API round trips; results keep the compartment discovery order.
 
-            result["compartments"].append(compartment_data)
-            print()
+        Args:
+            on_compartment: Optional callback invoked from the calling thread with each
+                compartment's data as soon as it is available, in discovery order. The
+                results are then handed over to the callback instead of being kept, so
+                memory does not grow with the number of compartments.
+            compartment_ids: Only scan these compartments instead of the whole tenancy
+            infra_ids: Only fetch these infrastructures; takes precedence over compartment_ids
 
-        print(f"\nTotal: {total_infrastructures} infrastructure(s), {total_vm_clusters} VM cluster(s)\n")
+        Returns:
+            Dictionary with the tenancy_id, a CompartmentResult per compartment holding Exadata
+            (empty when on_compartment is given), and the errors of compartments or
+            infrastructures that could not be scanned
+        """
+        result = {
+            "tenancy_id": self.tenancy_id,
+            "compartments": [],
+            "errors": []
+        }
+
+        if infra_ids:
+            scanned = self._scan_infrastructure_ids(infra_ids, result["errors"])
+        else:
+            # Scan each compartment for Exadata resources
+            compartments_to_scan = self._compartments_to_scan(compartment_ids, result["errors"])
+            scanned = self._scan_compartments(compartments_to_scan, result["errors"])
+
+        total_infrastructures = total_vm_clusters = 0
+        for compartment in scanned:
+            total_infrastructures += len(compartment.infrastructures)
+            total_vm_clusters += sum(len(infra.vm_clusters) for infra in compartment.infrastructures)
+
+            if on_compartment:
+                on_compartment(compartment)
+            else:
+                result["compartments"].append(compartment)
+
+        self.log.info(f"Total: {total_infrastructures} infrastructure(s), {total_vm_clusters} VM cluster(s)")
+        if result["errors"]:
+            self.log.warning(f"{len(result['errors'])} compartment(s) or infrastructure(s) could not be scanned")
         return result
 
 
-def format_infrastructure_summary(infra_data: Dict) -> str:
+def compartment_to_json(compartment: CompartmentResult) -> Dict:
+    """Convert a CompartmentResult to a JSON-serializable dict."""
+    return {
+        "compartment_id": compartment.compartment_id,
+        "compartment_name": compartment.compartment_name,
+        "infrastructures": [
+            {
+                "infrastructure": {
+                    field: getattr(infra_result.infrastructure, field) for field in INFRASTRUCTURE_JSON_FIELDS
+                },
+                "vm_clusters": [
+                    {field: getattr(cluster_result.cluster, field) for field in VM_CLUSTER_JSON_FIELDS}
+                    for cluster_result in infra_result.vm_clusters
+                ]
+            }
+            for infra_result in compartment.infrastructures
+        ]
+    }
+
+
+class JsonStreamWriter:
+    """
+    Incrementally writes the {"tenancy_id": ..., "compartments": [...], "errors": [...]} JSON document.
+
+    Each compartment is serialized with orjson and flushed as soon as it is written,
+    so the full result never has to be held as one dict. The output is laid out like
+    json.dump(..., indent=2), with non-ASCII characters written as UTF-8.
+    """
+
+    def __init__(self, f: BinaryIO, tenancy_id: str):
+        """
+        Start the JSON document.
+
+        Args:
+            f: Binary file opened for writing
+            tenancy_id: Tenancy OCID written as the document's tenancy_id
+        """
+        self.f = f
+        self.count = 0
+        self.f.write(b'{\n  "tenancy_id": ' + orjson.dumps(tenancy_id) + b',\n  "compartments": [')
+
+    def write_compartment(self, compartment_dict: Dict) -> None:
+        """Append one compartment to the compartments array and flush it to disk."""
+        chunk = orjson.dumps(compartment_dict, option=JSON_OPTIONS).replace(b"\n", b"\n    ")
+        self.f.write((b"," if self.count else b"") + b"\n    " + chunk)
+        self.f.flush()
+        self.count += 1
+
+    def close(self, errors: Optional[List[Dict]] = None) -> None:
+        """
+        Terminate the compartments array and the JSON document.
+
+        Args:
+            errors: Per-compartment scan errors, written as an "errors" array if given
+        """
+        self.f.write(b"\n  ]" if self.count else b"]")
+        if errors is not None:
+            self.f.write(b',\n  "errors": ' + orjson.dumps(errors, option=JSON_OPTIONS).replace(b"\n", b"\n  "))
+        self.f.write(b"\n}")
+        self.f.flush()
+
+
+def format_infrastructure_summary(infra_result: InfraResult) -> str:
     """Format infrastructure data for display."""
-    infra = infra_data["infrastructure"]
-    ocpu_info = infra_data.get("ocpu_info")
-    unallocated = infra_data.get("unallocated_resources")
-
-    output = []
-    output.append("=" * 80)
-    output.append(f"INFRASTRUCTURE: {infra.display_name}")
-    output.append("=" * 80)
-    output.append(f"OCID: {infra.id}")
-    output.append(f"State: {infra.lifecycle_state}")
-    output.append(f"Shape: {infra.shape}")
-    output.append(f"Availability Domain: {infra.availability_domain}")
-    output.append(f"Created: {infra.time_created}")
-
-    output.append("\nHARDWARE:")
-    output.append(f"  Compute Servers: {infra.compute_count}")
-    output.append(f"  Storage Servers: {infra.storage_count}")
-
-    output.append("\nRESOURCES:")
-    output.append(f"  CPUs: {infra.cpus_enabled} / {infra.max_cpu_count}")
-    output.append(f"  Memory: {infra.memory_size_in_gbs} GB / {infra.max_memory_in_gbs} GB")
-    output.append(f"  DB Node Storage: {infra.db_node_storage_size_in_gbs} GB")
-    output.append(f"  Data Storage: {infra.data_storage_size_in_tbs} TB / {infra.max_data_storage_in_t_bs} TB")
-
-    if ocpu_info:
-        output.append("\nOCPU INFO:")
-        output.append(f"  Total: {ocpu_info.total_cpu_count}")
-        output.append(f"  Consumed: {ocpu_info.consumed_cpu_count}")
-
-    if unallocated:
-        output.append("\nUNALLOCATED:")
-        output.append(f"  Available CPUs: {unallocated.available_cpus}")
-
-    output.append("\nNETWORK:")
-    output.append(f"  Admin CIDR: {infra.admin_network_cidr}")
-    output.append(f"  InfiniBand CIDR: {infra.infini_band_network_cidr}")
-    output.append(f"  Gateway: {infra.gateway}")
-
-    output.append("\nSOFTWARE:")
-    output.append(f"  Storage Server Version: {infra.storage_server_version}")
-    output.append(f"  DB Server Version: {infra.db_server_version}")
-
-    output.append("\nMAINTENANCE:")
-    if infra.maintenance_slo_status:
-        output.append(f"  SLO Status: {infra.maintenance_slo_status}")
-
-    return "\n".join(output)
-
-
-def format_vm_cluster_summary(cluster_data: Dict) -> str:
+    infra = infra_result.infrastructure
+    ocpu_info = infra_result.ocpu_info
+    unallocated = infra_result.unallocated_resources
+
+    # Bind model attributes to locals once; SDK model attributes are property lookups
+    name, ocid, state, shape = infra.display_name, infra.id, infra.lifecycle_state, infra.shape
+    ad, created = infra.availability_domain, infra.time_created
+    compute_count, storage_count = infra.compute_count, infra.storage_count
+    cpus, max_cpus = infra.cpus_enabled, infra.max_cpu_count
+    memory, max_memory = infra.memory_size_in_gbs, infra.max_memory_in_gbs
+    db_node_storage = infra.db_node_storage_size_in_gbs
+    data_storage, max_data_storage = infra.data_storage_size_in_tbs, infra.max_data_storage_in_t_bs
+    admin_cidr, ib_cidr, gateway = infra.admin_network_cidr, infra.infini_band_network_cidr, infra.gateway
+    storage_version, db_version = infra.storage_server_version, infra.db_server_version
+    slo_status = infra.maintenance_slo_status
+
+    ocpu_block = (
+        f"\nOCPU INFO:\n"
+        f"  Total: {ocpu_info.total_cpu_count}\n"
+        f"  Consumed: {ocpu_info.consumed_cpu_count}\n"
+    ) if ocpu_info else ""
+    unallocated_block = (
+        f"\nUNALLOCATED:\n"
+        f"  Available CPUs: {unallocated.available_cpus}\n"
+    ) if unallocated else ""
+    slo_line = f"\n  SLO Status: {slo_status}" if slo_status else ""
+
+    return f"""{"=" * 80}
+INFRASTRUCTURE: {name}
+{"=" * 80}
+OCID: {ocid}
+State: {state}
+Shape: {shape}
+Availability Domain: {ad}
+Created: {created}
+
+HARDWARE:
+  Compute Servers: {compute_count}
+  Storage Servers: {storage_count}
+
+RESOURCES:
+  CPUs: {cpus} / {max_cpus}
+  Memory: {memory} GB / {max_memory} GB
+  DB Node Storage: {db_node_storage} GB
+  Data Storage: {data_storage} TB / {max_data_storage} TB
+{ocpu_block}{unallocated_block}
+NETWORK:
+  Admin CIDR: {admin_cidr}
+  InfiniBand CIDR: {ib_cidr}
+  Gateway: {gateway}
+
+SOFTWARE:
+  Storage Server Version: {storage_version}
+  DB Server Version: {db_version}
+
+MAINTENANCE:{slo_line}"""
+
+
+def format_compartment_report(compartment: CompartmentResult) -> str:
+    """Format a compartment's infrastructures and VM clusters for display."""
+    lines = [
+        f"\nCOMPARTMENT: {compartment.compartment_name}",
+        f"OCID: {compartment.compartment_id}",
+        "=" * 80
+    ]
+
+    for infra_result in compartment.infrastructures:
+        lines.append(format_infrastructure_summary(infra_result))
+
+        if infra_result.vm_clusters:
+            lines.append(f"\n  VM CLUSTERS: {len(infra_result.vm_clusters)}")
+            lines.extend(format_vm_cluster_summary(cluster_result) for cluster_result in infra_result.vm_clusters)
+        else:
+            lines.append("\n  No VM clusters found for this infrastructure.")
+
+        lines.append("\n")
+
+    return "\n".join(lines)
+
+
+def format_vm_cluster_summary(cluster_result: VmClusterResult) -> str:
     """Format VM cluster data for display."""
-    cluster = cluster_data["cluster"]
-    iorm_config = cluster_data.get("iorm_config")
-
-    output = []
-    output.append("\n  " + "-" * 76)
-    output.append(f"  VM CLUSTER: {cluster.display_name}")
-    output.append("  " + "-" * 76)
-    output.append(f"  OCID: {cluster.id}")
-    output.append(f"  State: {cluster.lifecycle_state}")
-    output.append(f"  Shape: {cluster.shape}")
-    output.append(f"  Cluster Type: {cluster.vm_cluster_type}")
-
-    output.append("\n  SOFTWARE:")
-    output.append(f"    Grid Infrastructure: {cluster.gi_version}")
-    output.append(f"    System Version: {cluster.system_version}")
-
-    output.append("\n  RESOURCES:")
-    output.append(f"    CPUs Enabled: {cluster.cpus_enabled}")
-    output.append(f"    OCPUs Enabled: {cluster.ocpus_enabled}")
-    output.append(f"    Memory: {cluster.memory_size_in_gbs} GB")
-    output.append(f"    DB Node Storage: {cluster.db_node_storage_size_in_gbs} GB")
-    output.append(f"    Data Storage: {cluster.data_storage_size_in_tbs} TB")
-
-    output.append("\n  CONFIGURATION:")
-    output.append(f"    License Model: {cluster.license_model}")
-    output.append(f"    Local Backup: {cluster.is_local_backup_enabled}")
-    output.append(f"    Sparse Diskgroup: {cluster.is_sparse_diskgroup_enabled}")
-    output.append(f"    Storage Management: {cluster.storage_management_type}")
-    output.append(f"    Compute Model: {cluster.compute_model}")
-
-    if cluster.db_servers:
-        output.append(f"\n  DATABASE SERVERS: {len(cluster.db_servers)}")
-
-    if iorm_config:
-        output.append(f"\n  IORM:")
-        output.append(f"    State: {iorm_config.lifecycle_state}")
-        output.append(f"    Objective: {iorm_config.objective}")
-
-    return "\n".join(output)
+    cluster = cluster_result.cluster
+    iorm_config = cluster_result.iorm_config
+
+    # Bind model attributes to locals once; SDK model attributes are property lookups
+    name, ocid, state, shape = cluster.display_name, cluster.id, cluster.lifecycle_state, cluster.shape
+    cluster_type, gi_version, system_version = cluster.vm_cluster_type, cluster.gi_version, cluster.system_version
+    cpus, ocpus, memory = cluster.cpus_enabled, cluster.ocpus_enabled, cluster.memory_size_in_gbs
+    db_node_storage, data_storage = cluster.db_node_storage_size_in_gbs, cluster.data_storage_size_in_tbs
+    license_model, local_backup = cluster.license_model, cluster.is_local_backup_enabled
+    sparse_diskgroup, storage_management = cluster.is_sparse_diskgroup_enabled, cluster.storage_management_type
+    compute_model, db_servers = cluster.compute_model, cluster.db_servers
+
+    db_servers_block = f"\n\n  DATABASE SERVERS: {len(db_servers)}" if db_servers else ""
+    iorm_block = (
+        f"\n\n  IORM:\n"
+        f"    State: {iorm_config.lifecycle_state}\n"
+        f"    Objective: {iorm_config.objective}"
+    ) if iorm_config else ""
+
+    return f"""
+  {"-" * 76}
+  VM CLUSTER: {name}
+  {"-" * 76}
+  OCID: {ocid}
+  State: {state}
+  Shape: {shape}
+  Cluster Type: {cluster_type}
+
+  SOFTWARE:
+    Grid Infrastructure: {gi_version}
+    System Version: {system_version}
+
+  RESOURCES:
+    CPUs Enabled: {cpus}
+    OCPUs Enabled: {ocpus}
+    Memory: {memory} GB
+    DB Node Storage: {db_node_storage} GB
+    Data Storage: {data_storage} TB
+
+  CONFIGURATION:
+    License Model: {license_model}
+    Local Backup: {local_backup}
+    Sparse Diskgroup: {sparse_diskgroup}
+    Storage Management: {storage_management}
+    Compute Model: {compute_model}{db_servers_block}{iorm_block}"""
+
+
+def configure_logging(verbosity: int = 0) -> QueueListener:
+    """
+    Send log records through a queue to a background thread writing to stdout.
+
+    Worker threads only enqueue records, so progress output neither blocks the scan
+    nor interleaves partial lines.
+
+    Args:
+        verbosity: -1 for warnings only, 0 for progress, 1 for debug output of this
+            script, 2 or more to also show debug output of the OCI SDK and its HTTP stack
+
+    Returns:
+        Started QueueListener; call stop() to flush pending records
+    """
+    log_queue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(
+        "%(message)s" if verbosity < 1 else "%(asctime)s %(levelname)s %(name)s: %(message)s"
+    ))
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if verbosity >= 2 else logging.WARNING)
+
+    if verbosity < 0:
+        logger.setLevel(logging.WARNING)
+    elif verbosity == 0:
+        logger.setLevel(logging.INFO)
+    else:
+        logger.setLevel(logging.DEBUG)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -451,6 +1240,19 @@ Examples:
 
   # Specify custom output file
   python prototype_fetch_exadata.py --output my_data.json
+
+  # Rediscover compartments instead of using the cached list
+  python prototype_fetch_exadata.py --refresh-cache
+
+  # Only print the report, without scan progress
+  python prototype_fetch_exadata.py --quiet
+
+  # Only scan specific compartments
+  python prototype_fetch_exadata.py --compartment-id ocid1.compartment.oc1..aaa \\
+      --compartment-id ocid1.compartment.oc1..bbb
+
+  # Only fetch a specific infrastructure
+  python prototype_fetch_exadata.py --infra-id ocid1.exadatainfrastructure.oc1..aaa
         """
     )
 
@@ -468,6 +1270,52 @@ Examples:
         default="exadata_data.json"
     )
 
+    parser.add_argument(
+        "--compartment-id",
+        dest="compartment_ids",
+        action="append",
+        metavar="OCID",
+        help="Only scan this compartment instead of the whole tenancy (repeatable)"
+    )
+
+    parser.add_argument(
+        "--infra-id",
+        dest="infra_ids",
+        action="append",
+        metavar="OCID",
+        help="Only fetch this Exadata infrastructure (repeatable, overrides --compartment-id)"
+    )
+
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore the cached compartment list and rediscover compartments"
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        help=f"Lifetime of the cached compartment list in seconds (default: {DEFAULT_CACHE_TTL}, 0 disables reuse)",
+        default=DEFAULT_CACHE_TTL
+    )
+
+    verbosity_group = parser.add_mutually_exclusive_group()
+
+    verbosity_group.add_argument(
+        "--verbose",
+        "-v",
+        action="count",
+        default=0,
+        help="Show debug output (-vv also shows OCI SDK and HTTP debug output)"
+    )
+
+    verbosity_group.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only show warnings and errors while scanning"
+    )
+
     args = parser.parse_args()
 
     print("=" * 80)
@@ -475,94 +1323,74 @@ Examples:
     print("=" * 80)
     print()
 
-    try:
-        # Initialize fetcher
-        fetcher = ExadataDataFetcher(profile=args.profile)
+    listener = configure_logging(-1 if args.quiet else args.verbose)
 
-        # Fetch all data from all compartments
-        data = fetcher.fetch_all_data()
+    try:
+        try:
+            # Initialize fetcher
+            fetcher = ExadataDataFetcher(
+                profile=args.profile,
+                cache_ttl=args.cache_ttl,
+                refresh_cache=args.refresh_cache
+            )
+
+            # Fetch all data from all compartments, streaming raw data to JSON for inspection.
+            # Results go to a .partial file that only replaces the output file once the scan
+            # finished, so an interrupted run keeps what it fetched without clobbering old data.
+            output_file = args.output
+            partial_file = output_file + ".partial"
+            logger.info(f"Saving raw data to {output_file}...")
+
+            # Each compartment is written to JSON and rendered to report text as soon as it
+            # is scanned, so the SDK models are not kept until the end of the scan
+            report = []
+
+            def on_compartment(compartment: CompartmentResult) -> None:
+                writer.write_compartment(compartment_to_json(compartment))
+                report.append(format_compartment_report(compartment))
+
+            with open(partial_file, 'wb') as f:
+                writer = JsonStreamWriter(f, fetcher.tenancy_id)
+                try:
+                    data = fetcher.fetch_all_data(
+                        on_compartment=on_compartment,
+                        compartment_ids=args.compartment_ids,
+                        infra_ids=args.infra_ids
+                    )
+                except BaseException:
+                    writer.close()
+                    logger.warning(f"Scan aborted, partial results kept in {partial_file}")
+                    raise
+                writer.close(data["errors"])
+
+            os.replace(partial_file, output_file)
+            logger.info("Data saved successfully!")
+        finally:
+            # Flush queued progress messages so they precede the report below
+            listener.stop()
 
+        print()
         print("=" * 80)
         print("RESULTS")
         print("=" * 80)
         print()
 
-        if not data["compartments"]:
+        if data["errors"]:
+            print(f"WARNING: {len(data['errors'])} compartment(s) or infrastructure(s) could not be scanned:")
+            for error in data["errors"]:
+                print(f"  {error.get('compartment_id') or error['infrastructure_id']}: {error['error']}")
+            print()
+
+        if not report:
             print("No Exadata infrastructures found.")
-            return
 
         # Display results
-        for compartment_data in data["compartments"]:
-            print(f"\nCOMPARTMENT: {compartment_data['compartment_name']}")
-            print(f"OCID: {compartment_data['compartment_id']}")
-            print("=" * 80)
-
-            for infra_data in compartment_data["infrastructures"]:
-                print(format_infrastructure_summary(infra_data["details"]))
-
-                if infra_data["vm_clusters"]:
-                    print(f"\n  VM CLUSTERS: {len(infra_data['vm_clusters'])}")
-                    for cluster_data in infra_data["vm_clusters"]:
-                        print(format_vm_cluster_summary(cluster_data))
-                else:
-                    print("\n  No VM clusters found for this infrastructure.")
-
-                print("\n")
-
-        # Also save raw data to JSON for inspection
-        output_file = args.output
-        print(f"Saving raw data to {output_file}...")
-
-        # Convert OCI objects to dict for JSON serialization
-        json_data = {
-            "tenancy_id": data["tenancy_id"],
-            "compartments": []
-        }
-
-        for compartment_data in data["compartments"]:
-            compartment_dict = {
-                "compartment_id": compartment_data["compartment_id"],
-                "compartment_name": compartment_data["compartment_name"],
-                "infrastructures": []
-            }
+        for compartment_report in report:
+            print(compartment_report)
 
-            for infra_data in compartment_data["infrastructures"]:
-                infra_dict = {
-                    "infrastructure": {
-                        "id": infra_data["details"]["infrastructure"].id,
-                        "display_name": infra_data["details"]["infrastructure"].display_name,
-                        "lifecycle_state": infra_data["details"]["infrastructure"].lifecycle_state,
-                        "shape": infra_data["details"]["infrastructure"].shape,
-                        "compute_count": infra_data["details"]["infrastructure"].compute_count,
-                        "storage_count": infra_data["details"]["infrastructure"].storage_count,
-                        "cpus_enabled": infra_data["details"]["infrastructure"].cpus_enabled,
-                        "max_cpu_count": infra_data["details"]["infrastructure"].max_cpu_count,
-                        "memory_size_in_gbs": infra_data["details"]["infrastructure"].memory_size_in_gbs,
-                        "data_storage_size_in_tbs": infra_data["details"]["infrastructure"].data_storage_size_in_tbs,
-                    },
-                    "vm_clusters": []
-                }
-
-                for cluster_data in infra_data["vm_clusters"]:
-                    cluster_dict = {
-                        "id": cluster_data["cluster"].id,
-                        "display_name": cluster_data["cluster"].display_name,
-                        "lifecycle_state": cluster_data["cluster"].lifecycle_state,
-                        "gi_version": cluster_data["cluster"].gi_version,
-                        "cpus_enabled": cluster_data["cluster"].cpus_enabled,
-                        "memory_size_in_gbs": cluster_data["cluster"].memory_size_in_gbs,
-                        "data_storage_size_in_tbs": cluster_data["cluster"].data_storage_size_in_tbs,
-                    }
-                    infra_dict["vm_clusters"].append(cluster_dict)
-
-                compartment_dict["infrastructures"].append(infra_dict)
-
-            json_data["compartments"].append(compartment_dict)
-
-        with open(output_file, 'w') as f:
-            json.dump(json_data, f, indent=2)
-
-        print(f"Data saved successfully!")
+        # Results are usable but incomplete
+        if data["errors"]:
+            sys.exit(PARTIAL_RESULTS_EXIT_CODE)
 
     except Exception as e:
         print(f"\nError occurred: {e}")
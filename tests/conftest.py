@@ -0,0 +1,181 @@
+"""Shared fixtures: an ExadataDataFetcher wired to in-memory fake OCI clients."""
+
+import functools
+import types
+
+import oci
+import pytest
+
+# The SDK loads service packages lazily; load them before any test patches oci.config or
+# oci.signer, or the patched names would stay bound inside the service modules
+import oci.database
+import oci.identity
+import oci.resource_search
+from oci.response import Response
+
+import prototype_fetch_exadata
+
+TENANCY_ID = "ocid1.tenancy.oc1..tenancy"
+USER_ID = "ocid1.user.oc1..user"
+
+
+def response(data) -> Response:
+    """Wrap data in a single-page OCI response."""
+    return Response(200, {}, data, None)
+
+
+def not_found() -> oci.exceptions.ServiceError:
+    """ServiceError as returned for a missing or unauthorized resource."""
+    return oci.exceptions.ServiceError(404, "NotAuthorizedOrNotFound", {}, "Authorization failed or not found")
+
+
+class FakeIdentityClient:
+    """Identity service; list calls return raw camelCase JSON like a skip_deserialization client."""
+
+    def __init__(self):
+        self.compartments = {"c1": "compartment-1", "c2": "compartment-2", "c3": "compartment-3"}
+        self.list_calls = 0
+
+    def get_tenancy(self, tenancy_id, **kwargs):
+        return response(types.SimpleNamespace(id=tenancy_id, name="root"))
+
+    def get_compartment(self, compartment_id, **kwargs):
+        if compartment_id not in self.compartments:
+            raise not_found()
+        return response(types.SimpleNamespace(
+            id=compartment_id, name=self.compartments[compartment_id], lifecycle_state="ACTIVE"
+        ))
+
+    def list_compartments(self, compartment_id, **kwargs):
+        self.list_calls += 1
+        return response([
+            {"id": comp_id, "name": name, "lifecycleState": "ACTIVE"} for comp_id, name in self.compartments.items()
+        ])
+
+
+class FakeDatabaseClient:
+    """Database service holding infrastructures and VM clusters per compartment."""
+
+    def __init__(self):
+        self.infrastructures = {"c1": ["i1"], "c2": ["i2"], "c3": []}
+        self.vm_clusters = {"i1": ["v1", "v2"], "i2": ["v3"]}
+        # Compartment and resource OCIDs whose calls fail with 404
+        self.failing = set()
+
+    def _check(self, ocid):
+        if ocid in self.failing:
+            raise not_found()
+
+    def _compartment_of(self, infra_id):
+        for comp_id, infra_ids in self.infrastructures.items():
+            if infra_id in infra_ids:
+                return comp_id
+        raise not_found()
+
+    def list_exadata_infrastructures(self, compartment_id, **kwargs):
+        self._check(compartment_id)
+        return response([
+            {"id": infra_id, "displayName": f"infra-{infra_id}"}
+            for infra_id in self.infrastructures.get(compartment_id, [])
+        ])
+
+    def list_vm_clusters(self, compartment_id, **kwargs):
+        self._check(compartment_id)
+        return response([
+            {"id": cluster_id, "displayName": f"cluster-{cluster_id}", "exadataInfrastructureId": infra_id}
+            for infra_id in self.infrastructures.get(compartment_id, [])
+            for cluster_id in self.vm_clusters.get(infra_id, [])
+        ])
+
+    def get_exadata_infrastructure(self, exadata_infrastructure_id, **kwargs):
+        self._check(exadata_infrastructure_id)
+        return response(types.SimpleNamespace(
+            id=exadata_infrastructure_id,
+            display_name=f"infra-{exadata_infrastructure_id}",
+            compartment_id=self._compartment_of(exadata_infrastructure_id)
+        ))
+
+    def get_exadata_infrastructure_ocpus(self, exadata_infrastructure_id, **kwargs):
+        return response(types.SimpleNamespace(total_cpu_count=8, consumed_cpu_count=4))
+
+    def get_exadata_infrastructure_un_allocated_resources(self, exadata_infrastructure_id, **kwargs):
+        raise not_found()
+
+    def get_vm_cluster(self, vm_cluster_id, **kwargs):
+        self._check(vm_cluster_id)
+        return response(types.SimpleNamespace(id=vm_cluster_id, display_name=f"cluster-{vm_cluster_id}"))
+
+    def get_vm_cluster_iorm_config(self, vm_cluster_id, **kwargs):
+        return response(types.SimpleNamespace(lifecycle_state="ENABLED", objective="AUTO"))
+
+    def list_vm_cluster_patches(self, vm_cluster_id, **kwargs):
+        return response([])
+
+
+class FakeSearchClient:
+    """Resource Search reporting Exadata in compartment_ids; unavailable while that is None."""
+
+    def __init__(self):
+        self.compartment_ids = None
+
+    def search_resources(self, search_details, **kwargs):
+        if self.compartment_ids is None:
+            raise not_found()
+        return response(types.SimpleNamespace(items=[
+            types.SimpleNamespace(compartment_id=comp_id) for comp_id in self.compartment_ids
+        ]))
+
+
+class FakeSigner:
+    """Stand-in for oci.signer.Signer that needs no private key."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    @classmethod
+    def from_config(cls, config):
+        return cls()
+
+
+@pytest.fixture
+def oci_fakes(monkeypatch, tmp_path):
+    """Patch the OCI SDK entry points used by ExadataDataFetcher with in-memory fakes."""
+    fakes = types.SimpleNamespace(
+        identity=FakeIdentityClient(),
+        database=FakeDatabaseClient(),
+        search=FakeSearchClient(),
+        cache_dir=str(tmp_path / "cache")
+    )
+    # Passes oci.config.validate_config; the key itself is never loaded by FakeSigner
+    config = {
+        "tenancy": TENANCY_ID,
+        "user": USER_ID,
+        "fingerprint": ":".join(["aa"] * 16),
+        "key_content": "unused",
+        "region": "us-ashburn-1"
+    }
+
+    monkeypatch.setattr(oci.config, "from_file", lambda **kwargs: dict(config))
+    monkeypatch.setattr(oci.signer, "Signer", FakeSigner)
+    monkeypatch.setattr(oci.database, "DatabaseClient", lambda config, **kwargs: fakes.database)
+    monkeypatch.setattr(oci.identity, "IdentityClient", lambda config, **kwargs: fakes.identity)
+    monkeypatch.setattr(oci.resource_search, "ResourceSearchClient", lambda config, **kwargs: fakes.search)
+    monkeypatch.setattr(prototype_fetch_exadata, "_resize_connection_pool", lambda client: None)
+
+    cache_class = prototype_fetch_exadata._CompartmentCache
+
+    def make_cache(*args, **kwargs):
+        return cache_class(*args, cache_dir=fakes.cache_dir, **kwargs)
+
+    monkeypatch.setattr(prototype_fetch_exadata, "_CompartmentCache", make_cache)
+
+    # Compartment lookups are memoized process-wide, keyed by client identity
+    prototype_fetch_exadata._lookup_compartment.cache_clear()
+    yield fakes
+    prototype_fetch_exadata._lookup_compartment.cache_clear()
+
+
+@pytest.fixture
+def make_fetcher(oci_fakes):
+    """Build ExadataDataFetcher instances against the fakes of oci_fakes."""
+    return functools.partial(prototype_fetch_exadata.ExadataDataFetcher, profile="TEST")
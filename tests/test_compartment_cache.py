@@ -0,0 +1,109 @@
+"""Tests for the on-disk compartment cache and its use by ExadataDataFetcher."""
+
+import logging
+import os
+import time
+
+from prototype_fetch_exadata import _CompartmentCache
+
+COMPARTMENTS = [{"id": "c1", "name": "compartment-1", "lifecycle_state": "ACTIVE", "is_root": False}]
+
+
+def test_put_then_get_returns_compartments(tmp_path):
+    cache = _CompartmentCache("tenancy", "user", cache_dir=str(tmp_path))
+
+    cache.put(COMPARTMENTS)
+
+    assert cache.get() == COMPARTMENTS
+    # The temporary file is renamed into place, not left behind
+    assert os.listdir(tmp_path) == [os.path.basename(cache.path)]
+
+
+def test_users_of_a_tenancy_do_not_share_entries(tmp_path):
+    _CompartmentCache("tenancy", "user-a", cache_dir=str(tmp_path)).put(COMPARTMENTS)
+
+    assert _CompartmentCache("tenancy", "user-b", cache_dir=str(tmp_path)).get() is None
+
+
+def test_expired_entry_is_ignored(tmp_path):
+    cache = _CompartmentCache("tenancy", "user", ttl=60, cache_dir=str(tmp_path))
+    cache.put(COMPARTMENTS)
+
+    expired = time.time() - 61
+    os.utime(cache.path, (expired, expired))
+
+    assert cache.get() is None
+
+
+def test_missing_file_is_ignored(tmp_path):
+    assert _CompartmentCache("tenancy", "user", cache_dir=str(tmp_path)).get() is None
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    cache = _CompartmentCache("tenancy", "user", cache_dir=str(tmp_path))
+    with open(cache.path, "w") as f:
+        f.write('[{"id": "c1", "name"')
+
+    assert cache.get() is None
+
+
+def test_invalidate_removes_file(tmp_path):
+    cache = _CompartmentCache("tenancy", "user", cache_dir=str(tmp_path))
+    cache.put(COMPARTMENTS)
+
+    cache.invalidate()
+    cache.invalidate()
+
+    assert cache.get() is None
+    assert not os.path.exists(cache.path)
+
+
+def test_put_into_unwritable_directory_raises(tmp_path):
+    # A regular file in place of a parent directory fails even for root, unlike chmod
+    (tmp_path / "home").write_text("")
+    cache = _CompartmentCache("tenancy", "user", cache_dir=str(tmp_path / "home" / "cache"))
+
+    try:
+        cache.put(COMPARTMENTS)
+    except OSError:
+        pass
+    else:
+        raise AssertionError("put() into an unwritable directory did not raise")
+
+
+def test_list_all_compartments_reuses_cache(oci_fakes, make_fetcher):
+    first = make_fetcher().list_all_compartments()
+    second = make_fetcher().list_all_compartments()
+
+    assert second == first
+    assert oci_fakes.identity.list_calls == 1
+
+
+def test_refresh_cache_ignores_cached_list(oci_fakes, make_fetcher):
+    make_fetcher().list_all_compartments()
+    make_fetcher(refresh_cache=True).list_all_compartments()
+
+    assert oci_fakes.identity.list_calls == 2
+
+
+def test_list_all_compartments_survives_unwritable_cache(oci_fakes, make_fetcher, tmp_path, caplog):
+    (tmp_path / "home").write_text("")
+    oci_fakes.cache_dir = str(tmp_path / "home" / "cache")
+
+    with caplog.at_level(logging.WARNING):
+        compartments = make_fetcher().list_all_compartments()
+
+    assert [compartment["id"] for compartment in compartments] == ["ocid1.tenancy.oc1..tenancy", "c1", "c2", "c3"]
+    assert "Could not write compartment cache" in caplog.text
+
+
+def test_not_found_compartment_invalidates_cache(oci_fakes, make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.list_all_compartments()
+    assert os.path.exists(fetcher._compartment_cache.path)
+
+    oci_fakes.database.failing.add("c2")
+    result = fetcher.fetch_all_data()
+
+    assert result["errors"][0]["compartment_id"] == "c2"
+    assert not os.path.exists(fetcher._compartment_cache.path)
@@ -0,0 +1,64 @@
+"""Tests for the streaming JSON writer of prototype_fetch_exadata."""
+
+import io
+import json
+
+import pytest
+
+from prototype_fetch_exadata import JsonStreamWriter
+
+TENANCY_ID = "ocid1.tenancy.oc1..aaa"
+ERRORS = [{"compartment_id": "ocid1.compartment.oc1..x", "error": "404 - NotFound"}]
+
+
+def make_compartment(index: int) -> dict:
+    """Build a compartment dict shaped like the output of compartment_to_json."""
+    return {
+        "compartment_id": f"ocid1.compartment.oc1..c{index}",
+        "compartment_name": f"compartment-{index}",
+        "infrastructures": [
+            {
+                "infrastructure": {"id": f"ocid1.exadatainfrastructure.oc1..i{index}", "cpus_enabled": 8},
+                "vm_clusters": [
+                    {"id": f"ocid1.vmcluster.oc1..v{index}", "memory_size_in_gbs": 90.5},
+                    {"id": f"ocid1.vmcluster.oc1..w{index}", "gi_version": None},
+                ],
+            }
+        ] if index % 2 else [],
+    }
+
+
+def write_document(compartments, errors=None) -> str:
+    """Stream the compartments through a JsonStreamWriter and return the document."""
+    buffer = io.BytesIO()
+    writer = JsonStreamWriter(buffer, TENANCY_ID)
+    for compartment in compartments:
+        writer.write_compartment(compartment)
+    writer.close(errors)
+    return buffer.getvalue().decode("utf-8")
+
+
+@pytest.mark.parametrize("count", [0, 1, 5])
+@pytest.mark.parametrize("errors", [None, [], ERRORS])
+def test_matches_json_dumps(count, errors):
+    compartments = [make_compartment(index) for index in range(count)]
+
+    expected = {"tenancy_id": TENANCY_ID, "compartments": compartments}
+    if errors is not None:
+        expected["errors"] = errors
+
+    assert write_document(compartments, errors) == json.dumps(expected, indent=2)
+
+
+def test_writes_non_ascii_as_utf8():
+    compartment = {
+        "compartment_id": "ocid1.compartment.oc1..c",
+        "compartment_name": "Produção",
+        "infrastructures": [],
+    }
+
+    document = write_document([compartment])
+
+    assert document == json.dumps(
+        {"tenancy_id": TENANCY_ID, "compartments": [compartment]}, indent=2, ensure_ascii=False
+    )
@@ -0,0 +1,90 @@
+"""Tests for scans that keep going when single compartments or infrastructures fail."""
+
+import oci
+import pytest
+
+
+def scanned_ids(result):
+    return [compartment.compartment_id for compartment in result["compartments"]]
+
+
+def test_failing_compartment_is_recorded(oci_fakes, make_fetcher):
+    oci_fakes.database.failing.add("c1")
+
+    result = make_fetcher().fetch_all_data()
+
+    assert scanned_ids(result) == ["c2"]
+    assert [error["compartment_id"] for error in result["errors"]] == ["c1"]
+    assert result["errors"][0]["error"].startswith("404 - ")
+
+
+def test_failing_vm_cluster_fails_only_its_compartment(oci_fakes, make_fetcher):
+    oci_fakes.database.failing.add("v3")
+
+    result = make_fetcher().fetch_all_data()
+
+    assert scanned_ids(result) == ["c1"]
+    assert [error["compartment_id"] for error in result["errors"]] == ["c2"]
+
+
+def test_every_compartment_failing_raises(oci_fakes, make_fetcher):
+    fetcher = make_fetcher()
+    oci_fakes.database.failing.update([fetcher.tenancy_id, "c1", "c2", "c3"])
+
+    with pytest.raises(oci.exceptions.ServiceError):
+        fetcher.fetch_all_data()
+
+
+def test_results_are_passed_to_callback_instead_of_kept(oci_fakes, make_fetcher):
+    oci_fakes.database.failing.add("c1")
+    seen = []
+
+    result = make_fetcher().fetch_all_data(on_compartment=seen.append)
+
+    assert [compartment.compartment_id for compartment in seen] == ["c2"]
+    assert result["compartments"] == []
+    assert len(result["errors"]) == 1
+
+
+def test_unknown_compartment_id_is_recorded(oci_fakes, make_fetcher):
+    result = make_fetcher(refresh_cache=True).fetch_all_data(compartment_ids=["missing", "c1"])
+
+    assert scanned_ids(result) == ["c1"]
+    assert [error["compartment_id"] for error in result["errors"]] == ["missing"]
+
+
+def test_bad_infra_id_is_recorded(oci_fakes, make_fetcher):
+    result = make_fetcher().fetch_all_data(infra_ids=["i1", "bad", "i2"])
+
+    assert scanned_ids(result) == ["c1", "c2"]
+    assert [infra.infrastructure.id for infra in result["compartments"][0].infrastructures] == ["i1"]
+    assert len(result["compartments"][0].infrastructures[0].vm_clusters) == 2
+    assert [error["infrastructure_id"] for error in result["errors"]] == ["bad"]
+
+
+def test_every_infra_id_bad_raises(oci_fakes, make_fetcher):
+    with pytest.raises(oci.exceptions.ServiceError):
+        make_fetcher().fetch_all_data(infra_ids=["bad", "worse"])
+
+
+def test_run_each_with_no_items(oci_fakes, make_fetcher):
+    errors = []
+
+    results = list(make_fetcher()._run_each(str, [], str, "compartment_id", errors))
+
+    assert results == []
+    assert errors == []
+
+
+def test_run_each_keeps_order_and_records_failures(oci_fakes, make_fetcher):
+    def work(item):
+        if item % 2:
+            raise ValueError(f"odd {item}")
+        return item * 10
+
+    errors = []
+
+    results = list(make_fetcher()._run_each(work, list(range(5)), str, "item_id", errors))
+
+    assert results == [0, 20, 40]
+    assert errors == [{"item_id": "1", "error": "odd 1"}, {"item_id": "3", "error": "odd 3"}]
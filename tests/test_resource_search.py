@@ -0,0 +1,35 @@
+"""Tests for narrowing the scan with Resource Search."""
+
+
+def scanned_ids(result):
+    return [compartment.compartment_id for compartment in result["compartments"]]
+
+
+def test_search_limits_scanned_compartments(oci_fakes, make_fetcher):
+    oci_fakes.search.compartment_ids = ["c2"]
+
+    assert scanned_ids(make_fetcher().fetch_all_data()) == ["c2"]
+
+
+def test_unavailable_search_scans_every_compartment(oci_fakes, make_fetcher):
+    assert scanned_ids(make_fetcher().fetch_all_data()) == ["c1", "c2"]
+
+
+def test_compartment_missing_from_cache_is_rediscovered(oci_fakes, make_fetcher):
+    make_fetcher().list_all_compartments()
+
+    # Created after the cache was written, and already holding Exadata
+    oci_fakes.identity.compartments["c4"] = "compartment-4"
+    oci_fakes.database.infrastructures["c4"] = ["i4"]
+    oci_fakes.search.compartment_ids = ["c1", "c4"]
+
+    assert scanned_ids(make_fetcher().fetch_all_data()) == ["c1", "c4"]
+    assert oci_fakes.identity.list_calls == 2
+
+
+def test_freshly_listed_compartments_are_not_rediscovered(oci_fakes, make_fetcher):
+    # A compartment the search index still reports but that is no longer accessible
+    oci_fakes.search.compartment_ids = ["c1", "deleted"]
+
+    assert scanned_ids(make_fetcher().fetch_all_data()) == ["c1"]
+    assert oci_fakes.identity.list_calls == 1
@@ -0,0 +1,42 @@
+"""Tests for building the request signer shared by the OCI clients."""
+
+import oci
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from prototype_fetch_exadata import ExadataDataFetcher
+
+
+@pytest.fixture
+def private_key_pem() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()
+    ).decode("ascii")
+
+
+@pytest.fixture
+def api_key_config():
+    return {
+        "tenancy": "ocid1.tenancy.oc1..tenancy",
+        "user": "ocid1.user.oc1..user",
+        "fingerprint": ":".join(["aa"] * 16),
+        "region": "us-ashburn-1",
+    }
+
+
+@pytest.mark.parametrize("key_source", ["key_file", "key_content"])
+def test_api_key_profiles_build_a_signer(monkeypatch, tmp_path, private_key_pem, api_key_config, key_source):
+    if key_source == "key_file":
+        key_file = tmp_path / "oci_api_key.pem"
+        key_file.write_text(private_key_pem)
+        api_key_config["key_file"] = str(key_file)
+    else:
+        api_key_config["key_content"] = private_key_pem
+    monkeypatch.setattr(oci.config, "from_file", lambda **kwargs: dict(api_key_config))
+
+    fetcher = ExadataDataFetcher(profile="TEST")
+
+    assert isinstance(fetcher.signer, oci.signer.Signer)
+    assert fetcher.db_client.base_client.signer is fetcher.signer